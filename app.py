@@ -1,9 +1,13 @@
-import json
+import mmap
 import os
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from itertools import compress
+from operator import attrgetter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QUrl, QTimer
+import orjson
+
+from PySide6.QtCore import Qt, QUrl, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication,
@@ -17,11 +21,25 @@ from PySide6.QtWidgets import (
     QTextEdit,
     QMessageBox,
 )
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PySide6.QtMultimediaWidgets import QVideoWidget
+
+if TYPE_CHECKING:
+    # imported lazily at runtime so the multimedia backend only starts with a session
+    from PySide6.QtMultimedia import QMediaPlayer
+
+
+# JSON fields of a Word, in constructor order
+_WORD_KEYS = (
+    "term",
+    "beginTimestamp",
+    "endTimestamp",
+    "englishMeaning",
+    "turkishMeaning",
+    "sampleSentenceInEnglish",
+    "sampleSentenceInTurkish",
+)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Word:
     term: str
     beginTimestamp: str
@@ -30,12 +48,16 @@ class Word:
     turkishMeaning: str
     sampleSentenceInEnglish: str
     sampleSentenceInTurkish: str
+    begin_ms: int  # beginTimestamp minus 1 second
+    end_ms: int  # endTimestamp plus 1 second
 
-    def begin_ms(self) -> int:
-        return timestamp_to_ms(self.beginTimestamp) - 1000  # minus 1 second
-
-    def end_ms(self) -> int:
-        return timestamp_to_ms(self.endTimestamp) + 1000  # plus 1 second
+    @classmethod
+    def from_dict(cls, d: dict) -> "Word":
+        return cls(
+            *[d[k] for k in _WORD_KEYS],
+            timestamp_to_ms(d["beginTimestamp"]) - 1000,
+            timestamp_to_ms(d["endTimestamp"]) + 1000,
+        )
 
 
 def timestamp_to_ms(ts: str) -> int:
@@ -52,10 +74,85 @@ def ms_to_timestamp(ms: int) -> str:
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
+def check_video_file(path: str):
+    if not os.path.isfile(path) or os.path.getsize(path) == 0:
+        raise ValueError(f"Video file not found or empty: {path}")
+
+
+def load_json_file(path: str):
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+class WorkerSignals(QObject):
+    done = Signal(object)
+    error = Signal(str)
+
+
+class LoadRunnable(QRunnable):
+    """Reads and parses a word list off the GUI thread.
+
+    Either ``path`` is read from disk or, when given, the in-memory ``text``
+    is parsed instead. Emits ``(words, data)`` on success.
+    """
+
+    def __init__(self, path: str, text: Optional[bytes] = None):
+        super().__init__()
+        self.path = path
+        self.text = text
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            if self.text is not None:
+                data = orjson.loads(self.text)
+            else:
+                data = load_json_file(self.path)
+            words = tuple([Word.from_dict(d) for d in data])
+        except KeyError as e:
+            self.signals.error.emit(f"Missing field {e} in word entry")
+            return
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if not words:
+            self.signals.error.emit("The word list is empty")
+            return
+        self.signals.done.emit((words, data))
+
+
+class SaveRunnable(QRunnable):
+    """Serializes and writes a word list off the GUI thread."""
+
+    def __init__(self, data: List[dict], out_path: str):
+        super().__init__()
+        self.data = data
+        self.out_path = out_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            with open(self.out_path, "wb") as f:
+                f.write(payload)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.done.emit(self.out_path)
+
+
 class UploadWidget(QWidget):
+    CLIPBOARD_LABEL = "<clipboard>"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Vocabulary Learning App")
+        self.clipboard_json: Optional[bytes] = None
         layout = QVBoxLayout()
 
         self.video_path = QLineEdit()
@@ -112,10 +209,8 @@ class UploadWidget(QWidget):
     def use_clipboard(self):
         text = QApplication.clipboard().text()
         if text:
-            tmp = os.path.join(os.getcwd(), "clipboard.json")
-            with open(tmp, "w", encoding="utf-8") as f:
-                f.write(text)
-            self.json_path.setText(tmp)
+            self.clipboard_json = text.encode("utf-8")
+            self.json_path.setText(self.CLIPBOARD_LABEL)
         else:
             QMessageBox.warning(self, "Clipboard", "Clipboard is empty")
 
@@ -127,40 +222,117 @@ class UploadWidget(QWidget):
             QMessageBox.warning(self, "Input", "Please provide video, SRT and JSON files")
             return
         try:
-            with open(json_file, encoding="utf-8") as f:
-                data = json.load(f)
-            words = [Word(**d) for d in data]
-        except Exception as e:
-            QMessageBox.critical(self, "JSON Error", str(e))
+            check_video_file(video)
+        except ValueError as e:
+            QMessageBox.critical(self, "Video Error", str(e))
             return
+        text = None
+        if self.clipboard_json is not None and json_file == self.CLIPBOARD_LABEL:
+            text = self.clipboard_json
+            # the filtered list is saved next to where clipboard.json used to be written
+            json_file = os.path.join(os.getcwd(), "clipboard.json")
+        self.start_btn.setEnabled(False)
+        self.session_paths = (video, json_file)
+        self.load_job = LoadRunnable(json_file, text)
+        self.load_job.signals.done.connect(self.on_loaded)
+        self.load_job.signals.error.connect(self.on_load_failed)
+        QThreadPool.globalInstance().start(self.load_job)
+
+    def on_loaded(self, result: Tuple[Tuple[Word, ...], List[dict]]):
+        words, data = result
+        video, json_file = self.session_paths
+        self.start_btn.setEnabled(True)
+        try:
+            self.session = SessionWidget(video, words, data, json_file)
+        except ValueError as e:
+            # the video went away while the word list was loading
+            QMessageBox.critical(self, "Video Error", str(e))
+            return
+        self.session.aborted.connect(self.show)
         self.hide()
-        self.session = SessionWidget(video, words, json_file)
         self.session.show()
 
+    def on_load_failed(self, message: str):
+        self.start_btn.setEnabled(True)
+        QMessageBox.critical(self, "JSON Error", message)
+
+
+def shared_player() -> "QMediaPlayer":
+    """Return the application-wide media player, creating it on first use.
+
+    Sessions reuse one player and audio output instead of building a new
+    backend pipeline each time.
+    """
+    app = QApplication.instance()
+    player = getattr(app, "_shared_player", None)
+    if player is None:
+        from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+
+        player = QMediaPlayer(app)
+        audio = QAudioOutput(app)
+        player.setAudioOutput(audio)
+        app._shared_player = player
+        app._shared_audio = audio
+    return player
+
 
 class SessionWidget(QWidget):
-    def __init__(self, video_path: str, words: List[Word], json_path: str):
+    # emitted when the session closes early because the video cannot be played
+    aborted = Signal()
+
+    EN_PREFIX = "English: "
+    TR_PREFIX = "Turkish: "
+    SAMPLE_EN_PREFIX = "Example: "
+    SAMPLE_TR_PREFIX = "Türkçe: "
+
+    # values stored in self.responses
+    UNSEEN = 0
+    KNOWN = 1
+    UNKNOWN = 2
+    # maps responses to 1 for words kept by finish() and 0 for known ones
+    KEEP_TABLE = bytes([1] * KNOWN + [0] + [1] * (255 - KNOWN))
+
+    # long example sentences are elided to roughly this many wrapped lines
+    SAMPLE_MAX_LINES = 4
+
+    # playback starts only once navigation has been idle this long
+    NAV_DEBOUNCE_MS = 120
+
+    def __init__(self, video_path: str, words: Tuple[Word, ...], raw: List[dict], json_path: str):
+        check_video_file(video_path)
         super().__init__()
         self.setWindowTitle("Vocabulary Session")
         self.video_path = video_path
         self.words = words
+        self.last = len(words) - 1
+        self.raw = raw  # the parsed JSON entries, written back as-is by finish()
         self.json_path = json_path
         self.current = 0
-        self.responses: List[Optional[bool]] = [None] * len(words)
+        self.responses = bytearray(len(words))  # one of UNSEEN, KNOWN, UNKNOWN per word
+        self.sample_cache: Dict[int, Tuple[str, str]] = {}  # word index -> elided sample texts
+        self.sample_refresh_pending = False
 
         layout = QHBoxLayout(self)
 
         # Video Area
-        self.player = QMediaPlayer()
-        self.audio = QAudioOutput()
-        self.player.setAudioOutput(self.audio)
+        from PySide6.QtMultimediaWidgets import QVideoWidget
+
+        self.player = shared_player()
+        self.audio = self.player.audioOutput()
         self.video_widget = QVideoWidget()
-        self.player.setVideoOutput(self.video_widget)
+        self.pending_segment: Optional[Word] = None
+        self.media_loaded = False
+        self.player_attached = False
+        self.abort_pending = False
+        self.abort_message = ""
 
         layout.addWidget(self.video_widget, 65)
 
         # Right side text
-        right_layout = QVBoxLayout()
+        # own widget so update_ui can batch repaints without touching the video
+        self.side_panel = QWidget()
+        right_layout = QVBoxLayout(self.side_panel)
+        right_layout.setContentsMargins(0, 0, 0, 0)
         self.term_label = QLabel()
         self.term_label.setStyleSheet("font-size:24px; font-weight:bold;")
         self.meaning_en = QLabel()
@@ -168,9 +340,20 @@ class SessionWidget(QWidget):
         self.sample_en = QLabel()
         self.sample_tr = QLabel()
         for w in [self.term_label, self.meaning_en, self.meaning_tr, self.sample_en, self.sample_tr]:
+            w.setTextFormat(Qt.TextFormat.PlainText)
             w.setWordWrap(True)
             right_layout.addWidget(w)
 
+        # fields shown verbatim by update_ui, with their label prefixes and setters;
+        # the example sentences go through elided_samples instead
+        self.get_fields = attrgetter("term", "englishMeaning", "turkishMeaning")
+        self.field_labels = tuple(
+            zip(
+                ("", self.EN_PREFIX, self.TR_PREFIX),
+                (self.term_label.setText, self.meaning_en.setText, self.meaning_tr.setText),
+            )
+        )
+
         button_layout = QHBoxLayout()
         self.know_btn = QPushButton("I already knew")
         self.know_btn.setStyleSheet("background-color:green; color:white;")
@@ -191,45 +374,152 @@ class SessionWidget(QWidget):
         nav_layout.addWidget(self.next_btn)
         right_layout.addLayout(nav_layout)
 
-        layout.addLayout(right_layout, 35)
+        layout.addWidget(self.side_panel, 35)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.check_position)
+        self.nav_timer = QTimer(self)
+        self.nav_timer.setSingleShot(True)
+        self.nav_timer.timeout.connect(self.play_current)
+
+        self.stop_ms = 0
 
         self.update_ui()
+        # last, so a session that fails to build never stays wired to the shared player
+        self.attach_player()
+
+    def attach_player(self):
+        from PySide6.QtMultimedia import QMediaPlayer
+
+        self.player.setVideoOutput(self.video_widget)
+        self.player.mediaStatusChanged.connect(self.on_media_status_changed)
+        self.player.errorOccurred.connect(self.on_player_error)
+        self.player.positionChanged.connect(self.on_position_changed)
+        self.player_attached = True
+        source = QUrl.fromLocalFile(self.video_path)
+        # the shared player may already have this video open from an earlier session
+        self.media_loaded = self.player.source() == source and self.player.mediaStatus() in (
+            QMediaPlayer.MediaStatus.LoadedMedia,
+            QMediaPlayer.MediaStatus.BufferingMedia,
+            QMediaPlayer.MediaStatus.BufferedMedia,
+            QMediaPlayer.MediaStatus.EndOfMedia,
+        )
+        if not self.media_loaded:
+            if self.player.source() == source:
+                # same URL after a failed load: setSource ignores unchanged sources, so clear it first
+                self.player.setSource(QUrl())
+            self.player.setSource(source)
 
     def update_ui(self):
         w = self.words[self.current]
-        self.term_label.setText(w.term)
-        self.meaning_en.setText(f"English: {w.englishMeaning}")
-        self.meaning_tr.setText(f"Turkish: {w.turkishMeaning}")
-        self.sample_en.setText(f"Example: {w.sampleSentenceInEnglish}")
-        self.sample_tr.setText(f"Türkçe: {w.sampleSentenceInTurkish}")
-
-        self.play_segment(w)
-        self.prev_btn.setEnabled(self.current > 0)
-        if self.current == len(self.words) - 1:
-            self.next_btn.setText("Finish")
-        else:
-            self.next_btn.setText("Next")
+        # batch the label and button changes into a single repaint of the side panel
+        self.side_panel.setUpdatesEnabled(False)
+        try:
+            for (prefix, set_text), value in zip(self.field_labels, self.get_fields(w)):
+                set_text(prefix + value)
+            sample_en, sample_tr = self.elided_samples(self.current)
+            self.sample_en.setText(sample_en)
+            self.sample_tr.setText(sample_tr)
+
+            self.prev_btn.setEnabled(self.current > 0)
+            if self.current == self.last:
+                self.next_btn.setText("Finish")
+            else:
+                self.next_btn.setText("Next")
+        finally:
+            self.side_panel.setUpdatesEnabled(True)
+
+        self.nav_timer.start(self.NAV_DEBOUNCE_MS)
+
+    def elided_samples(self, idx: int) -> Tuple[str, str]:
+        cached = self.sample_cache.get(idx)
+        if cached is None:
+            w = self.words[idx]
+            fm = self.sample_en.fontMetrics()
+            width = max(1, self.sample_en.width()) * self.SAMPLE_MAX_LINES
+            cached = (
+                fm.elidedText(self.SAMPLE_EN_PREFIX + w.sampleSentenceInEnglish, Qt.TextElideMode.ElideRight, width),
+                fm.elidedText(self.SAMPLE_TR_PREFIX + w.sampleSentenceInTurkish, Qt.TextElideMode.ElideRight, width),
+            )
+            self.sample_cache[idx] = cached
+        return cached
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # elided texts depend on the label width, recompute them once resizing settles
+        self.sample_cache.clear()
+        if not self.sample_refresh_pending:
+            self.sample_refresh_pending = True
+            QTimer.singleShot(0, self.refresh_samples)
+
+    def refresh_samples(self):
+        self.sample_refresh_pending = False
+        sample_en, sample_tr = self.elided_samples(self.current)
+        self.sample_en.setText(sample_en)
+        self.sample_tr.setText(sample_tr)
+
+    def play_current(self):
+        self.play_segment(self.words[self.current])
 
     def play_segment(self, w: Word):
-        self.player.setSource(QUrl.fromLocalFile(self.video_path))
-        self.player.setPosition(max(0, w.begin_ms()))
+        self.stop_ms = w.end_ms
+        if not self.media_loaded:
+            # seeking before the media is loaded is ignored, replay once it is
+            self.pending_segment = w
+            return
+        self.player.setPosition(max(0, w.begin_ms))
         self.player.play()
-        self.stop_ms = w.end_ms()
-        self.timer.start(100)
 
-    def check_position(self):
-        if self.player.position() >= self.stop_ms:
+    def on_media_status_changed(self, status: "QMediaPlayer.MediaStatus"):
+        from PySide6.QtMultimedia import QMediaPlayer
+
+        if status == QMediaPlayer.MediaStatus.LoadedMedia and not self.media_loaded:
+            self.media_loaded = True
+            if self.pending_segment is not None:
+                w, self.pending_segment = self.pending_segment, None
+                self.play_segment(w)
+
+    def on_position_changed(self, pos: int):
+        if pos >= self.stop_ms and self.player.isPlaying():
             self.player.pause()
-            self.timer.stop()
+
+    def on_player_error(self, error: "QMediaPlayer.Error", message: str):
+        # some backends fail inside setSource, before on_loaded has connected aborted,
+        # so the session is torn down from the event loop instead
+        if not self.abort_pending:
+            self.abort_pending = True
+            self.abort_message = message
+            QTimer.singleShot(0, self.abort)
+
+    def abort(self):
+        if not self.player_attached:
+            return
+        self.player.stop()
+        QMessageBox.critical(self, "Video Error", self.abort_message or "The video could not be played")
+        # bring the upload window back before closing, otherwise the app quits
+        self.aborted.emit()
+        self.close()
+
+    def closeEvent(self, event):
+        self.detach_player()
+        super().closeEvent(event)
+
+    def detach_player(self):
+        # the player outlives this session, so stop it from calling back into it
+        if not self.player_attached:
+            return
+        self.player_attached = False
+        self.nav_timer.stop()
+        self.player.mediaStatusChanged.disconnect(self.on_media_status_changed)
+        self.player.errorOccurred.disconnect(self.on_player_error)
+        self.player.positionChanged.disconnect(self.on_position_changed)
+        if self.player.isPlaying():
+            self.player.pause()
+        self.player.setVideoOutput(None)
 
     def mark_known(self):
-        self.responses[self.current] = True
+        self.responses[self.current] = self.KNOWN
 
     def mark_unknown(self):
-        self.responses[self.current] = False
+        self.responses[self.current] = self.UNKNOWN
 
     def prev_word(self):
         if self.current > 0:
@@ -237,22 +527,32 @@ class SessionWidget(QWidget):
             self.update_ui()
 
     def next_word(self):
-        if self.current == len(self.words) - 1:
+        if self.current == self.last:
             self.finish()
             return
-        if self.current < len(self.words) - 1:
+        if self.current < self.last:
             self.current += 1
             self.update_ui()
 
     def finish(self):
+        self.nav_timer.stop()
         # filter out known words
-        filtered = [asdict(w) for idx, w in enumerate(self.words) if not self.responses[idx]]
+        filtered = list(compress(self.raw, self.responses.translate(self.KEEP_TABLE)))
         out_path = os.path.splitext(self.json_path)[0] + "_filtered.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(filtered, f, ensure_ascii=False, indent=4)
+        self.setEnabled(False)
+        self.save_job = SaveRunnable(filtered, out_path)
+        self.save_job.signals.done.connect(self.on_saved)
+        self.save_job.signals.error.connect(self.on_save_failed)
+        QThreadPool.globalInstance().start(self.save_job)
+
+    def on_saved(self, out_path: str):
         QMessageBox.information(self, "Session Complete", f"Saved filtered list to {out_path}")
         self.close()
 
+    def on_save_failed(self, message: str):
+        self.setEnabled(True)
+        QMessageBox.critical(self, "Save Error", message)
+
 
 def main():
     app = QApplication([])